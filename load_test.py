@@ -0,0 +1,139 @@
+"""Load test for the multi-worker deployment mode.
+
+Starts server.py against a throwaway database once per worker count, seeds it with
+repeating events and measures read throughput on /calendars and /events/expanded.
+
+    python load_test.py                      # 1, 2, 4, ... up to the number of cores
+    python load_test.py --workers 1 4 8 --duration 20 --clients 32
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import calendar
+import tempfile
+import datetime
+import subprocess
+import http.client
+import multiprocessing
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def request(conn: http.client.HTTPConnection, method: str, path: str, body: dict | None = None) -> int:
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    conn.request(method, path, body=json.dumps(body) if body is not None else None, headers=headers)
+    response = conn.getresponse()
+    response.read()
+    return response.status
+
+
+def wait_for_server(port: int, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            if request(conn, "GET", "/calendars") == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server on port {port} did not come up within {timeout}s")
+
+
+def seed(port: int, calendars: int = 5, events_per_calendar: int = 40):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    frequencies = ["none", "daily", "weekly", "monthly", "yearly"]
+    start = datetime.datetime(2025, 1, 6, 9, 0)
+    for c in range(calendars):
+        request(conn, "POST", "/calendars", {"name": f"Load test {c}", "color": "#4A90E2"})
+        for e in range(events_per_calendar):
+            event_start = start + datetime.timedelta(days=e * 3, hours=c)
+            request(conn, "POST", f"/calendars/{c + 1}/events", {
+                "title": f"Event {c}-{e}",
+                "start_time": event_start.isoformat(),
+                "end_time": (event_start + datetime.timedelta(hours=1)).isoformat(),
+                "repeat_frequency": frequencies[e % len(frequencies)],
+            })
+
+
+def client_loop(port: int, duration: float, client_id: int, results: "multiprocessing.Queue"):
+    # Cycle through the month views a user would page through, on a keep-alive connection
+    paths = ["/calendars"]
+    for month in range(1, 13):
+        last_day = calendar.monthrange(2025, month)[1]
+        paths.append(f"/events/expanded?start_date=2025-{month:02d}-01&end_date=2025-{month:02d}-{last_day:02d}")
+
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    completed = errors = 0
+    i = client_id
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        try:
+            if request(conn, "GET", paths[i % len(paths)]) == 200:
+                completed += 1
+            else:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn = http.client.HTTPConnection("127.0.0.1", port)
+        i += 1
+    results.put((completed, errors))
+
+
+def run(workers: int, port: int, duration: float, clients: int) -> tuple[float, int]:
+    db_path = tempfile.mktemp(prefix="mcal-load-", suffix=".db")
+    env = dict(os.environ, MCAL_WORKERS=str(workers), MCAL_DATABASE_URL=db_path, MCAL_HOST="127.0.0.1")
+    env.setdefault("GROQ_API_KEY", "load-test") # The AI endpoint is not exercised
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(BASE_DIR, "server.py"), str(port)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_server(port)
+        seed(port)
+
+        results: "multiprocessing.Queue" = multiprocessing.Queue()
+        procs = [multiprocessing.Process(target=client_loop, args=(port, duration, i, results)) for i in range(clients)]
+        for p in procs:
+            p.start()
+        totals = [results.get() for _ in procs]
+        for p in procs:
+            p.join()
+    finally:
+        server.terminate()
+        server.wait()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+    completed = sum(t[0] for t in totals)
+    errors = sum(t[1] for t in totals)
+    return completed / duration, errors
+
+
+def default_worker_counts() -> list[int]:
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure mCal read throughput per worker count.")
+    parser.add_argument("--workers", type=int, nargs="+", default=default_worker_counts())
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per run")
+    parser.add_argument("--clients", type=int, default=2 * (os.cpu_count() or 1), help="Concurrent client processes")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'req/s':>10} {'speedup':>8} {'errors':>7}")
+    baseline = None
+    for workers in args.workers:
+        throughput, errors = run(workers, args.port, args.duration, args.clients)
+        if baseline is None:
+            baseline = throughput or 1.0
+        print(f"{workers:>8} {throughput:>10.1f} {throughput / baseline:>7.2f}x {errors:>7}")
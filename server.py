@@ -1,12 +1,18 @@
 import os
 import sqlite3
 import datetime
+import threading
+import queue
+import asyncio
+from collections import OrderedDict
 from typing import List, Optional, Literal, Any
 from fastapi import FastAPI, HTTPException, Query, Path, File, UploadFile, Form # type: ignore
+from fastapi.concurrency import run_in_threadpool # type: ignore
 from fastapi.middleware.cors import CORSMiddleware # type: ignore
 from fastapi.responses import FileResponse, JSONResponse # type: ignore
 from pydantic import BaseModel, validator # type: ignore
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
+import anyio.to_thread # type: ignore
 import calendar as py_calendar # To avoid conflict with our Calendar model
 import base64
 import io
@@ -15,12 +21,39 @@ from groq import Groq
 import json
 
 #%% --- Configuration ---
-DATABASE_URL = "calendar.db"
+# Every setting can be overridden through an MCAL_* environment variable so the same
+# file works for local development and for a multi-worker production deployment.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__)) # Paths resolve from here, not from the cwd
+
+def _env_int(name: str, default: int) -> int:
+    """Reads a positive integer from the environment, falling back to default."""
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        print(f"Warning: Invalid value '{value}' for {name}. Using default {default}.")
+        return default
+    if parsed < 1:
+        print(f"Warning: {name} must be at least 1, got {parsed}. Using default {default}.")
+        return default
+    return parsed
+
+DATABASE_URL = os.path.join(BASE_DIR, os.environ.get("MCAL_DATABASE_URL", "calendar.db")) # Absolute paths are kept as-is
+HOST = os.environ.get("MCAL_HOST", "0.0.0.0")
+PORT = _env_int("MCAL_PORT", 8000)
+WORKERS = _env_int("MCAL_WORKERS", 1) # Number of uvicorn worker processes
+DB_BUSY_TIMEOUT_MS = _env_int("MCAL_DB_BUSY_TIMEOUT_MS", 5000) # How long SQLite waits on a locked database
+DB_POOL_SIZE = _env_int("MCAL_DB_POOL_SIZE", 8) # Idle SQLite connections kept per worker
+THREAD_POOL_SIZE = _env_int("MCAL_THREAD_POOL_SIZE", 40) # Threads per worker for the sync endpoints
+CACHE_SIZE = _env_int("MCAL_CACHE_SIZE", 128) # Cached /events/expanded responses per worker
+AI_CONCURRENCY = _env_int("MCAL_AI_CONCURRENCY", 4) # Concurrent Groq requests per worker
 MAX_REPEATING_OCCURRENCES = 500 # Safety limit for events without repeat_until
 
 ai_model_name = "meta-llama/llama-4-scout-17b-16e-instruct"
 
-def get_groq_api_key(filepath: str = "groq.token") -> str | None:
+def get_groq_api_key(filepath: str = os.path.join(BASE_DIR, "groq.token")) -> str | None:
     """Reads the Groq API key from the specified file."""
     try:
         with open(filepath, "r") as f:
@@ -42,15 +75,90 @@ client = Groq(api_key=get_groq_api_key())
 
 
 # --- Database Setup ---
-def get_db_connection():
-    conn = sqlite3.connect(DATABASE_URL)
+# Each worker process keeps its own pool of SQLite connections. Reads run concurrently
+# (WAL mode); writes go through db_write(), which serializes them inside the worker with
+# a lock and across workers with BEGIN IMMEDIATE plus the busy timeout.
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection whose close() hands it back to the worker's pool."""
+    checked_out: bool = False
+
+    def close(self):
+        _release_db_connection(self)
+
+_db_pool: "queue.LifoQueue[PooledConnection]" = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+_db_write_lock = threading.Lock()
+
+def _open_db_connection() -> PooledConnection:
+    conn = sqlite3.connect(
+        DATABASE_URL,
+        timeout=DB_BUSY_TIMEOUT_MS / 1000,
+        check_same_thread=False, # Connections move between threadpool threads via the pool
+        factory=PooledConnection
+    )
     conn.row_factory = sqlite3.Row # Access columns by name
     conn.execute("PRAGMA foreign_keys = ON;") # Enforce foreign key constraints
+    conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS};")
+    conn.execute("PRAGMA synchronous = NORMAL;") # Safe with WAL, avoids an fsync per commit
     return conn
 
+def _release_db_connection(conn: PooledConnection):
+    if not conn.checked_out: # Already returned (double close)
+        return
+    conn.checked_out = False
+    try:
+        if conn.in_transaction:
+            conn.rollback() # Never hand out a connection with a dangling transaction
+        _db_pool.put_nowait(conn)
+    except (queue.Full, sqlite3.Error):
+        sqlite3.Connection.close(conn)
+
+def close_db_pool():
+    while True:
+        try:
+            conn = _db_pool.get_nowait()
+        except queue.Empty:
+            return
+        sqlite3.Connection.close(conn)
+
+def get_db_connection() -> PooledConnection:
+    try:
+        conn = _db_pool.get_nowait()
+    except queue.Empty:
+        conn = _open_db_connection()
+    conn.checked_out = True
+    return conn
+
+@contextmanager
+def db_write():
+    """Yields a connection inside a write transaction and commits it on success.
+
+    BEGIN IMMEDIATE takes SQLite's write lock up front, so a worker waiting on another
+    worker's write blocks for up to the busy timeout instead of failing halfway through.
+    Every committed write bumps the data version, which invalidates the caches of all workers.
+    """
+    conn = get_db_connection()
+    try:
+        with _db_write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'data_version'")
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+    finally:
+        conn.close()
+
+def get_data_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()
+    return row['value'] if row else 0
+
 def create_tables():
     conn = get_db_connection()
     cursor = conn.cursor()
+    # WAL lets readers proceed while another worker writes; the setting is stored in the db file
+    cursor.execute("PRAGMA journal_mode = WAL;")
     # Calendars Table
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS calendars (
@@ -75,9 +183,51 @@ def create_tables():
         FOREIGN KEY (calendar_id) REFERENCES calendars(id) ON DELETE CASCADE
     )
     """)
+    # Meta Table (data_version is bumped on every write, see db_write)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    )
+    """)
+    cursor.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('data_version', 0)")
     conn.commit()
     conn.close()
 
+# --- Caches ---
+class VersionedCache:
+    """Small per-worker LRU cache that empties itself whenever the data version changes."""
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _sync(self, version: int) -> bool:
+        # Versions only grow, so a newer one drops every entry and an older one is stale
+        if self._version is None or version > self._version:
+            self._entries.clear()
+            self._version = version
+        return version == self._version
+
+    def get(self, key, version: int):
+        with self._lock:
+            if not self._sync(version):
+                return None
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, version: int, value):
+        with self._lock:
+            if not self._sync(version): # Computed from data that has since changed
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
 #%% --- Pydantic Models ---
 # Calendar Models
 class CalendarBase(BaseModel):
@@ -151,10 +301,12 @@ class AISuggestPayload(BaseModel):
 #%% --- FastAPI Application Setup ---
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Create tables
+    # Startup: Create tables and size this worker's threadpool for the sync endpoints
     create_tables()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
     yield
-    # Shutdown: (Optional: close db connections if you had a global pool)
+    # Shutdown: Close this worker's pooled db connections
+    close_db_pool()
 
 app = FastAPI(lifespan=lifespan, title="Simple Calendar API")
 
@@ -167,6 +319,10 @@ app.add_middleware(
     allow_headers=["*"], # Allows all headers
 )
 
+calendars_cache = VersionedCache(maxsize=1) # Holds the full calendar list under a single key
+expanded_events_cache = VersionedCache(maxsize=CACHE_SIZE)
+ai_semaphore = asyncio.Semaphore(AI_CONCURRENCY)
+
 #%% --- Helper Functions ---
 def _adjust_for_all_day(event_data: dict):
     """Adjusts start_time and end_time if is_all_day is true.
@@ -245,36 +401,42 @@ def _calendar_to_json(calendar: Calendar) -> dict:
         "color": calendar.color
     }
 
+def _get_calendars() -> dict[int, Calendar]:
+    """Returns all calendars keyed by id, served from the worker cache while the data is unchanged."""
+    conn = get_db_connection()
+    try:
+        version = get_data_version(conn)
+        calendars = calendars_cache.get("all", version)
+        if calendars is None:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id, name, color FROM calendars")
+            calendars = {row['id']: Calendar(id=row['id'], name=row['name'], color=row['color']) for row in cursor.fetchall()}
+            calendars_cache.put("all", version, calendars)
+        return calendars
+    finally:
+        conn.close()
+
 #%% --- Calendar Endpoints ---
 @app.post("/calendars", response_model=Calendar, status_code=201)
 def create_calendar_api(calendar: CalendarCreate):
-    conn = get_db_connection()
     try:
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO calendars (name, color) VALUES (?, ?)",
-            (calendar.name, calendar.color)
-        )
-        conn.commit()
-        calendar_id = cursor.lastrowid
-        # Create a Calendar instance before passing to _calendar_to_json
-        created_calendar = Calendar(id=calendar_id, name=calendar.name, color=calendar.color)
-        return JSONResponse(content=_calendar_to_json(created_calendar), status_code=201)
+        with db_write() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO calendars (name, color) VALUES (?, ?)",
+                (calendar.name, calendar.color)
+            )
+            calendar_id = cursor.lastrowid
     except sqlite3.IntegrityError: # For UNIQUE constraint on name
         raise HTTPException(status_code=400, detail=f"Calendar with name '{calendar.name}' already exists.")
-    finally:
-        conn.close()
+    # Create a Calendar instance before passing to _calendar_to_json
+    created_calendar = Calendar(id=calendar_id, name=calendar.name, color=calendar.color)
+    return JSONResponse(content=_calendar_to_json(created_calendar), status_code=201)
         
 
 @app.get("/calendars", response_model=List[Calendar])
 def get_calendars_api():
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, name, color FROM calendars")
-    calendars_data = cursor.fetchall()
-    conn.close()
-    # Convert rows to Calendar models before serializing
-    calendars_models = [Calendar(id=row['id'], name=row['name'], color=row['color']) for row in calendars_data]
+    calendars_models = _get_calendars().values()
     return JSONResponse(content=[_calendar_to_json(cal) for cal in calendars_models])
 
 @app.post("/calendars/{calendar_id}/events", response_model=Event, status_code=201)
@@ -285,9 +447,8 @@ def create_event_api(calendar_id: int, event: EventCreate):
     event_data = event.model_dump() # start_time, end_time are datetime objects here
     event_data = _adjust_for_all_day(event_data) # start_time, end_time are still datetime objects
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    try:
+    with db_write() as conn:
+        cursor = conn.cursor()
         cursor.execute(
             """
             INSERT INTO events (calendar_id, title, description, location, start_time, end_time, 
@@ -302,60 +463,46 @@ def create_event_api(calendar_id: int, event: EventCreate):
                 event_data["repeat_until"].isoformat() if event_data["repeat_until"] else None
             )
         )
-        conn.commit()
         event_id = cursor.lastrowid
-        # Construct the full Event model for the response
-        created_event_model = Event(
-            id=event_id,
-            calendar_id=calendar_id,
-            **event_data # event_data still has datetime objects for times
-        )
-        return JSONResponse(content=_event_to_json(created_event_model), status_code=201)
-    finally:
-        conn.close()
+    # Construct the full Event model for the response
+    created_event_model = Event(
+        id=event_id,
+        calendar_id=calendar_id,
+        **event_data # event_data still has datetime objects for times
+    )
+    return JSONResponse(content=_event_to_json(created_event_model), status_code=201)
 
 @app.get("/calendars/{calendar_id}", response_model=Calendar)
 def get_calendar_api(calendar_id: int = Path(..., gt=0)):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, name, color FROM calendars WHERE id = ?", (calendar_id,))
-    row = cursor.fetchone()
-    conn.close()
-    if row is None:
+    calendar_model = _get_calendars().get(calendar_id)
+    if calendar_model is None:
         raise HTTPException(status_code=404, detail="Calendar not found")
-    # Convert row to Calendar model before serializing
-    calendar_model = Calendar(id=row['id'], name=row['name'], color=row['color'])
     return JSONResponse(content=_calendar_to_json(calendar_model))
 
 @app.put("/calendars/{calendar_id}", response_model=Calendar)
 def update_calendar_api(calendar_id: int, calendar_update: CalendarCreate):
-    conn = get_db_connection()
     try:
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE calendars SET name = ?, color = ? WHERE id = ?",
-            (calendar_update.name, calendar_update.color, calendar_id)
-        )
-        conn.commit()
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Calendar not found")
-        # Return the updated Calendar model
-        updated_calendar = Calendar(id=calendar_id, name=calendar_update.name, color=calendar_update.color)
-        return JSONResponse(content=_calendar_to_json(updated_calendar))
+        with db_write() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE calendars SET name = ?, color = ? WHERE id = ?",
+                (calendar_update.name, calendar_update.color, calendar_id)
+            )
+            if cursor.rowcount == 0:
+                raise HTTPException(status_code=404, detail="Calendar not found")
     except sqlite3.IntegrityError:
         raise HTTPException(status_code=400, detail=f"Calendar with name '{calendar_update.name}' already exists.")
-    finally:
-        conn.close()
+    # Return the updated Calendar model
+    updated_calendar = Calendar(id=calendar_id, name=calendar_update.name, color=calendar_update.color)
+    return JSONResponse(content=_calendar_to_json(updated_calendar))
 
 @app.delete("/calendars/{calendar_id}", status_code=204)
 def delete_calendar_api(calendar_id: int = Path(..., gt=0)):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM calendars WHERE id = ?", (calendar_id,))
-    conn.commit()
-    if cursor.rowcount == 0:
-        raise HTTPException(status_code=404, detail="Calendar not found")
-    conn.close()
+    with db_write() as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM calendars WHERE id = ?", (calendar_id,))
+        if cursor.rowcount == 0:
+            raise HTTPException(status_code=404, detail="Calendar not found")
     return None # No content
 
 # --- Event Endpoints ---
@@ -454,30 +601,37 @@ def get_expanded_events_api(
         raise HTTPException(status_code=400, detail="start_date cannot be after end_date")
 
     conn = get_db_connection()
-    cursor = conn.cursor()
+    try:
+        version = get_data_version(conn)
+        cache_key = (start_date, end_date, calendar_id)
+        cached_occurrences = expanded_events_cache.get(cache_key, version)
+        if cached_occurrences is not None:
+            return cached_occurrences
 
-    sql_query = """
-    SELECT e.*, c.color as calendar_color 
-    FROM events e
-    JOIN calendars c ON e.calendar_id = c.id
-    WHERE 
-        date(e.start_time) <= ? 
-        AND (
-            e.repeat_frequency = 'none' OR 
-            e.repeat_until IS NULL OR 
-            date(e.repeat_until) >= ?
-        )
-    """
-    params: List[Any] = [end_date.isoformat(), start_date.isoformat()]
+        cursor = conn.cursor()
 
-    if calendar_id:
-        sql_query += " AND e.calendar_id = ?"
-        params.append(calendar_id)
+        sql_query = """
+        SELECT e.*, c.color as calendar_color 
+        FROM events e
+        JOIN calendars c ON e.calendar_id = c.id
+        WHERE 
+            date(e.start_time) <= ? 
+            AND (
+                e.repeat_frequency = 'none' OR 
+                e.repeat_until IS NULL OR 
+                date(e.repeat_until) >= ?
+            )
+        """
+        params: List[Any] = [end_date.isoformat(), start_date.isoformat()]
 
-    cursor.execute(sql_query, tuple(params))
-    
-    base_events_data = cursor.fetchall()
-    conn.close()
+        if calendar_id:
+            sql_query += " AND e.calendar_id = ?"
+            params.append(calendar_id)
+
+        cursor.execute(sql_query, tuple(params))
+        base_events_data = cursor.fetchall()
+    finally:
+        conn.close()
 
     all_occurrences = []
     for row in base_events_data:
@@ -488,6 +642,7 @@ def get_expanded_events_api(
         all_occurrences.extend(occurrences)
 
     all_occurrences.sort(key=lambda x: x.start_time)
+    expanded_events_cache.put(cache_key, version, all_occurrences)
     # EventOccurrence already has datetime objects, FastAPI will handle serialization.
     return all_occurrences
 
@@ -500,7 +655,7 @@ async def upload_data(payload: AISuggestPayload):
     text: str = payload.text if payload.text else ""
     image_b64: str = payload.image_b64 if payload.image_b64 else ""
 
-    with open("./ai_tool.md", "r") as f:
+    with open(os.path.join(BASE_DIR, "ai_tool.md"), "r") as f:
         ai_tool_prompt = f.read()
     
     ai_tool_prompt = ai_tool_prompt.replace("[[REPLACE_CURRENT_DATE]]", datetime.datetime.now().strftime("%Y-%m-%d"))
@@ -519,24 +674,27 @@ async def upload_data(payload: AISuggestPayload):
                 }
             })
     
-    completion = client.chat.completions.create(
-        model=ai_model_name,
-        messages=[
-            {
-                "role": "user",
-                "content": message_content
-            }
-        ],
-        temperature=1,
-        max_tokens=4096,
-        top_p=1,
-        stream=False,
-        stop=None
-    )
+    # The Groq SDK call is blocking: run it off the event loop, and cap how many run at once
+    async with ai_semaphore:
+        completion = await run_in_threadpool(
+            client.chat.completions.create,
+            model=ai_model_name,
+            messages=[
+                {
+                    "role": "user",
+                    "content": message_content
+                }
+            ],
+            temperature=1,
+            max_tokens=4096,
+            top_p=1,
+            stream=False,
+            stop=None
+        )
 
     result_text: str = completion.choices[0].message.content
 
-    with open("ai_tool_response.txt", "w", encoding="utf-8") as f:
+    with open(os.path.join(BASE_DIR, "ai_tool_response.txt"), "w", encoding="utf-8") as f:
         f.write(result_text)
 
     if result_text.count("```json") == 1 and result_text.count("```") == 2:
@@ -564,9 +722,8 @@ def update_event_api(event_id: int, event_update: EventCreate):
     event_data = event_update.model_dump() # start_time, end_time are datetime objects
     event_data = _adjust_for_all_day(event_data) # start_time, end_time are still datetime objects
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    try:
+    with db_write() as conn:
+        cursor = conn.cursor()
         cursor.execute(
             """
             UPDATE events SET title = ?, description = ?, location = ?, start_time = ?, end_time = ?,
@@ -582,29 +739,24 @@ def update_event_api(event_id: int, event_update: EventCreate):
                 event_id
             )
         )
-        conn.commit()
         if cursor.rowcount == 0: # Should ideally not happen if initial check passed
             raise HTTPException(status_code=404, detail="Event not found during update (concurrent modification?).")
         
-        # Construct the full Event model for the response
-        updated_event_model = Event(
-            id=event_id,
-            calendar_id=existing_event_model.calendar_id, # Use original calendar_id
-            **event_data # event_data has datetime objects for times
-        )
-        return JSONResponse(content=_event_to_json(updated_event_model))
-    finally:
-        conn.close()
+    # Construct the full Event model for the response
+    updated_event_model = Event(
+        id=event_id,
+        calendar_id=existing_event_model.calendar_id, # Use original calendar_id
+        **event_data # event_data has datetime objects for times
+    )
+    return JSONResponse(content=_event_to_json(updated_event_model))
 
 @app.delete("/events/{event_id}", status_code=204)
 def delete_event_api(event_id: int = Path(..., gt=0)):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM events WHERE id = ?", (event_id,))
-    conn.commit()
-    if cursor.rowcount == 0:
-        raise HTTPException(status_code=404, detail="Event not found")
-    conn.close()
+    with db_write() as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM events WHERE id = ?", (event_id,))
+        if cursor.rowcount == 0:
+            raise HTTPException(status_code=404, detail="Event not found")
     return None
 
 @app.get("/events/{event_id}", response_model=Event)
@@ -628,8 +780,9 @@ def catch_all(path: str):
         path = "favicon.png"
     
     # Ensure path is relative to web-frontend and secure
-    safe_path = os.path.normpath(os.path.join("web-frontend", path))
-    if not safe_path.startswith(os.path.normpath("web-frontend")):
+    frontend_dir = os.path.join(BASE_DIR, "web-frontend")
+    safe_path = os.path.normpath(os.path.join(frontend_dir, path))
+    if not safe_path.startswith(os.path.normpath(frontend_dir)):
         raise HTTPException(status_code=403, detail="Forbidden")
 
     if os.path.exists(safe_path) and os.path.isfile(safe_path):
@@ -638,24 +791,31 @@ def catch_all(path: str):
         # Try serving index.html for SPA-like behavior if path is a directory or not found
         # but only if it's not an obvious file request with an extension
         if '.' not in path.split('/')[-1]: # if no extension in last path segment
-            index_path = os.path.join("web-frontend", "index.html")
+            index_path = os.path.join(frontend_dir, "index.html")
             if os.path.exists(index_path):
                 return FileResponse(index_path)
         raise HTTPException(status_code=404, detail="File not found")
 
-# --- To run the app (for development) ---
+# --- To run the app ---
+# python server.py [port]; MCAL_WORKERS > 1 starts that many worker processes.
 if __name__ == "__main__":
     import uvicorn # type: ignore
     import sys
-    port = 8000
+    port = PORT
     if len(sys.argv) > 1:
         try:
             port = int(sys.argv[1])
         except ValueError:
             print(f"Warning: Invalid port '{sys.argv[1]}'. Using default port {port}.")
 
-    print(f"Starting server on http://0.0.0.0:{port}")
-    # Ensure create_tables is called before uvicorn starts if not using lifespan
-    # create_tables() # Not needed if lifespan is correctly implemented and used
+    print(f"Starting server on http://{HOST}:{port} with {WORKERS} worker(s), database {DATABASE_URL}")
+    # Create the schema and switch to WAL once, before the workers race to do it in their lifespan
+    create_tables()
+    close_db_pool()
 
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+    if WORKERS > 1:
+        # Worker processes import the app themselves, so uvicorn needs an import string
+        module_name = os.path.splitext(os.path.basename(__file__))[0]
+        uvicorn.run(f"{module_name}:app", app_dir=BASE_DIR, host=HOST, port=port, workers=WORKERS, log_level="info")
+    else:
+        uvicorn.run(app, host=HOST, port=port, log_level="info")